@@ -10,7 +10,7 @@ from tartufo.scanner import GitRepoScanner
 
 
 @click.command("scan-remote-repo")
-@click.option("--since-commit", help="Only scan from a given commit hash.", hidden=True)
+@click.option("--since-commit", help="Only scan from a given commit hash.")
 @click.option(
     "--max-depth",
     default=1000000,
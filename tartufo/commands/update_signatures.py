@@ -21,6 +21,9 @@ from tartufo.config import load_config_from_path
 from tartufo.scanner import GitRepoScanner
 
 DeprecationSetT = MutableSet[Sequence[str]]
+DEPRECATION_REGEX = re.compile(
+    r"DeprecationWarning: Signature (\w+) was.*use signature (\w+) instead\."
+)
 
 
 def unwrap_signature(data: Union[str, MutableMapping[str, str]]) -> str:
@@ -86,21 +89,8 @@ def get_deprecations(stderr: io.StringIO) -> DeprecationSetT:
     :param stderr: Stderr output from the scan-local-repo subcommand
     :returns: A set of tuples each containing the old and new signature
     """
-    deprecations: DeprecationSetT = set()
-    deprecation_rgx = re.compile(
-        r"DeprecationWarning: Signature (\w+) was.*use signature (\w+) instead\."
-    )
-
-    # Start at the beginning of the buffer
-    stderr.seek(0)
-    for line in stderr:
-        match = deprecation_rgx.search(line)
-
-        if match:
-            # This line had a deprecation warning
-            deprecations.add(match.groups())
-
-    return deprecations
+    # "." does not match a newline, so each match stays within a single line
+    return {match.groups() for match in DEPRECATION_REGEX.finditer(stderr.getvalue())}
 
 
 def replace_deprecated_signatures(
@@ -179,7 +169,7 @@ def remove_duplicated_entries(config_data: MutableMapping[str, Any]) -> int:
 
 
 @click.command("update-signatures")
-@click.option("--since-commit", help="Only scan from a given commit hash.", hidden=True)
+@click.option("--since-commit", help="Only scan from a given commit hash.")
 @click.option(
     "--max-depth",
     default=1000000,
@@ -1,7 +1,12 @@
+import os
 from pathlib import Path
 import platform
+import tempfile
+import unittest
 from dataclasses import fields
-from typing import Type, TypeVar
+from typing import TYPE_CHECKING, Type, TypeVar
+
+from click.testing import CliRunner
 
 WINDOWS = platform.system().lower() == "windows"
 PY_VERSION = platform.python_version_tuple()
@@ -14,6 +19,11 @@ DATA_PATH = REPO_ROOT_PATH.joinpath("tests", "data")
 
 OptionsType = TypeVar("OptionsType")  # pylint: disable=invalid-name
 
+if TYPE_CHECKING:
+    _MixinBase = unittest.TestCase
+else:
+    _MixinBase = object
+
 
 def get_data_path(*added_paths: str) -> Path:
     return Path.joinpath(DATA_PATH, *added_paths)
@@ -23,3 +33,36 @@ def generate_options(option_class: Type[OptionsType], **kwargs) -> OptionsType:
     option_args = {field.name: None for field in fields(option_class)}  # type: ignore [arg-type]
     option_args.update(kwargs)
     return option_class(**option_args)  # type: ignore
+
+
+class CliTestMixin(_MixinBase):
+    """Run tartufo's commands from an empty working directory.
+
+    ``CliRunner.invoke()`` takes all of its state as arguments, so one runner
+    serves every test in the class. The commands only need a working directory
+    that is not a git repository and holds no tartufo config, so the class
+    shares a single one, and every test starts out in it. Tests which write to
+    or delete from a directory should get their own from ``make_temp_dir()``.
+    """
+
+    runner: CliRunner
+    temp_dir: str
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.runner = CliRunner()
+        temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        cls.addClassCleanup(temp_dir.cleanup)
+        cls.temp_dir = temp_dir.name
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.temp_dir)
+
+    def make_temp_dir(self) -> str:
+        """Create a directory for this test alone, removed when it finishes."""
+        temp_dir = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(temp_dir.cleanup)
+        return temp_dir.name
@@ -178,6 +178,9 @@ class IssueTests(unittest.TestCase):
 
 
 class IncludeExcludePathsTests(ScannerTestCase):
+    # Compiled patterns are immutable, so the should_scan tests can share one.
+    FOO_DIR = re.compile(r"foo\/(.*)")
+
     @mock.patch("tartufo.config.compile_path_rules")
     def test_populated_included_paths_list_does_not_recompute(
         self, mock_compile: mock.MagicMock
@@ -229,28 +232,28 @@ class IncludeExcludePathsTests(ScannerTestCase):
     def test_should_scan_treats_included_paths_as_exclusive(self):
         test_scanner = TestScanner(self.options)
         test_scanner._included_paths = [  # pylint: disable=protected-access
-            re.compile(r"foo\/(.*)")
+            self.FOO_DIR
         ]
         self.assertFalse(test_scanner.should_scan("bar.txt"))
 
     def test_should_scan_includes_files_in_matched_paths(self):
         test_scanner = TestScanner(self.options)
         test_scanner._included_paths = [  # pylint: disable=protected-access
-            re.compile(r"foo\/(.*)")
+            self.FOO_DIR
         ]
         self.assertTrue(test_scanner.should_scan("foo/bar.txt"))
 
     def test_should_scan_allows_files_which_are_not_excluded(self):
         test_scanner = TestScanner(self.options)
         test_scanner._excluded_paths = [  # pylint: disable=protected-access
-            re.compile(r"foo\/(.*)")
+            self.FOO_DIR
         ]
         self.assertTrue(test_scanner.should_scan("bar.txt"))
 
     def test_should_scan_excludes_files_in_matched_paths(self):
         test_scanner = TestScanner(self.options)
         test_scanner._excluded_paths = [  # pylint: disable=protected-access
-            re.compile(r"foo\/(.*)")
+            self.FOO_DIR
         ]
         self.assertFalse(test_scanner.should_scan("foo/bar.txt"))
 
@@ -771,22 +774,28 @@ class EntropyDetectionTests(ScannerTestCase):
         self.assertEqual(self.scanner.calculate_entropy(""), 0.0)
 
     @mock.patch("tartufo.util.find_strings_by_regex")
-    def test_scan_entropy_find_b64_strings_for_every_word_in_diff(
+    def test_scan_entropy_find_b64_strings_for_every_line_in_diff(
         self, mock_strings: mock.MagicMock
     ):
         mock_strings.return_value = []
         list(self.scanner.scan_entropy(self.chunk))
         mock_strings.assert_has_calls(
             (
-                mock.call("foo", scanner.BASE64_REGEX),
-                mock.call("foo", scanner.HEX_REGEX),
-                mock.call("bar", scanner.BASE64_REGEX),
-                mock.call("bar", scanner.HEX_REGEX),
-                mock.call("asdfqwer", scanner.BASE64_REGEX),
-                mock.call("asdfqwer", scanner.HEX_REGEX),
+                mock.call("        foo bar", scanner.BASE64_REGEX),
+                mock.call("        foo bar", scanner.HEX_REGEX),
+                mock.call("        asdfqwer", scanner.BASE64_REGEX),
+                mock.call("        asdfqwer", scanner.HEX_REGEX),
             )
         )
 
+    def test_scan_entropy_finds_strings_separated_by_whitespace(self):
+        self.options.entropy_sensitivity = 0
+        test_scanner = TestScanner(self.options)
+        words = ["ghijklmnopqrstuvwxyz", "zyxwvutsrqponmlkjihg", "GHIJKLMNOPQRSTUVWXYZ"]
+        chunk = types.Chunk("\t".join(words[:2]) + "  " + words[2], "foo.py", {}, False)
+        issues = list(test_scanner.scan_entropy(chunk))
+        self.assertEqual([issue.matched_string for issue in issues], words)
+
     def test_sensitivity_low_end_calculation(self):
         self.options.entropy_sensitivity = 0
         test_scanner = TestScanner(self.options)
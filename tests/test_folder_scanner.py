@@ -80,6 +80,21 @@ class FolderScannerTestCase(unittest.TestCase):
         actual_issues = [issue.matched_string for issue in issues]
         self.assertEqual(2, actual_issues.count("KQ0I97OBuPlGB9yPRxoSxnX52zE="))
 
+    def test_directories_are_not_checked_against_path_patterns(self):
+        folder_path = pathlib.Path(__file__).parent / "data" / "scan_folder"
+        test_scanner = scanner.FolderScanner(self.global_options, folder_path, True)
+
+        with patch.object(
+            scanner.FolderScanner, "should_scan", return_value=True
+        ) as mock_should:
+            list(test_scanner._iter_folder())
+
+        checked = {call.args[0] for call in mock_should.call_args_list}
+        self.assertNotIn("scan_sub_folder", checked)
+        self.assertIn(
+            str(pathlib.Path("scan_sub_folder", "sub_folder_test.txt")), checked
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
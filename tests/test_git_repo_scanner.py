@@ -1,14 +1,43 @@
 # pylint: disable=protected-access
-import pathlib
 import re
+from types import SimpleNamespace
+from typing import List
 import unittest
 from unittest import mock
 
 import pygit2
 
-from tartufo import scanner, types
+from tartufo import config, scanner, types, util
 from tartufo.types import GlobalOptions, GitOptions, TartufoException, ConfigException
-from tests.helpers import generate_options
+from tests.helpers import generate_options, get_data_path
+
+INCLUSION_CONFIG = (
+    get_data_path("pyproject.toml"),
+    {
+        "include_path_patterns": (
+            {"path-pattern": "tartufo/", "reason": "Inclusion reason"},
+            {"path-pattern": "scripts/", "reason": "Inclusion reason"},
+        )
+    },
+)
+EXCLUSION_CONFIG = (
+    get_data_path("pyproject.toml"),
+    {
+        "exclude_path_patterns": (
+            {"path-pattern": "tests/", "reason": "Exclusion reason"},
+            {"path-pattern": r"\.venv/", "reason": "Exclusion reason"},
+            {"path-pattern": r".*\.egg-info/", "reason": "Exclusion reason"},
+        )
+    },
+)
+SIGNATURE_CONFIG = (
+    get_data_path("pyproject.toml"),
+    {
+        "exclude_signatures": (
+            {"signature": "foo", "reason": "Reason to exclude signature"},
+        )
+    },
+)
 
 
 class ScannerTestCase(unittest.TestCase):
@@ -18,19 +47,17 @@ class ScannerTestCase(unittest.TestCase):
 
 
 class RepoLoadTests(ScannerTestCase):
-    def setUp(self):
-        self.data_dir = pathlib.Path(__file__).parent / "data"
-        super().setUp()
+    data_dir = str(get_data_path())
 
-    @mock.patch("pygit2.Repository")
+    @mock.patch.object(pygit2, "Repository")
     def test_repo_is_loaded_on_init(self, mock_repo: mock.MagicMock):
         scanner.GitRepoScanner(self.global_options, self.git_options, ".")
         mock_repo.assert_called_once_with(".")
 
-    @mock.patch(
-        "tartufo.scanner.GitRepoScanner.filter_submodules", new=mock.MagicMock()
+    @mock.patch.object(
+        scanner.GitRepoScanner, "filter_submodules", new=mock.MagicMock()
     )
-    @mock.patch("pygit2.Repository")
+    @mock.patch.object(pygit2, "Repository")
     def test_load_repo_loads_new_repo(self, mock_repo: mock.MagicMock):
         test_scanner = scanner.GitRepoScanner(
             self.global_options, self.git_options, "."
@@ -45,8 +72,8 @@ class RepoLoadTests(ScannerTestCase):
             ]
         )
 
-    @mock.patch("pygit2.Repository")
-    @mock.patch("tartufo.scanner.GitRepoScanner.filter_submodules")
+    @mock.patch.object(pygit2, "Repository")
+    @mock.patch.object(scanner.GitRepoScanner, "filter_submodules")
     def test_load_repo_filters_submodules_when_specified(
         self, mock_filter: mock.MagicMock, mock_repo: mock.MagicMock
     ):
@@ -55,8 +82,8 @@ class RepoLoadTests(ScannerTestCase):
         scanner.GitRepoScanner(self.global_options, self.git_options, ".")
         mock_filter.assert_called_once_with(mock_repo.return_value)
 
-    @mock.patch("pygit2.Repository", new=mock.MagicMock())
-    @mock.patch("tartufo.scanner.GitRepoScanner.filter_submodules")
+    @mock.patch.object(pygit2, "Repository", new=mock.MagicMock())
+    @mock.patch.object(scanner.GitRepoScanner, "filter_submodules")
     def test_load_repo_does_not_filter_submodules_when_requested(
         self, mock_filter: mock.MagicMock
     ):
@@ -64,111 +91,76 @@ class RepoLoadTests(ScannerTestCase):
         scanner.GitRepoScanner(self.global_options, self.git_options, ".")
         mock_filter.assert_not_called()
 
-    @mock.patch("pygit2.Repository", new=mock.MagicMock())
-    @mock.patch("tartufo.config.load_config_from_path")
+    @mock.patch.object(pygit2, "Repository", new=mock.MagicMock())
+    @mock.patch.object(config, "load_config_from_path")
     def test_extra_inclusions_get_added(self, mock_load: mock.MagicMock):
         self.global_options.target_config = True
-        mock_load.return_value = (
-            self.data_dir / "pyproject.toml",
-            {
-                "include_path_patterns": (
-                    {"path-pattern": "tartufo/", "reason": "Inclusion reason"},
-                    {"path-pattern": "scripts/", "reason": "Inclusion reason"},
-                )
-            },
-        )
+        mock_load.return_value = INCLUSION_CONFIG
         self.global_options.include_path_patterns = (
             {"path-pattern": "foo/", "reason": "Inclusion reason"},
         )
         test_scanner = scanner.GitRepoScanner(
-            self.global_options, self.git_options, str(self.data_dir)
+            self.global_options, self.git_options, self.data_dir
         )
         test_scanner.load_repo("../tartufo")
-        self.assertCountEqual(
-            test_scanner.included_paths,
-            [re.compile("foo/"), re.compile("tartufo/"), re.compile("scripts/")],
+        self.assertEqual(
+            sorted(p.pattern for p in test_scanner.included_paths),
+            ["foo/", "scripts/", "tartufo/"],
         )
 
-    @mock.patch("pygit2.Repository", new=mock.MagicMock())
-    @mock.patch("tartufo.config.load_config_from_path")
+    @mock.patch.object(pygit2, "Repository", new=mock.MagicMock())
+    @mock.patch.object(config, "load_config_from_path")
     def test_extra_exclusions_get_added(self, mock_load: mock.MagicMock):
         self.global_options.target_config = True
-        mock_load.return_value = (
-            self.data_dir / "pyproject.toml",
-            {
-                "exclude_path_patterns": (
-                    {"path-pattern": "tests/", "reason": "Exclusion reason"},
-                    {"path-pattern": r"\.venv/", "reason": "Exclusion reason"},
-                    {"path-pattern": r".*\.egg-info/", "reason": "Exclusion reason"},
-                )
-            },
-        )
+        mock_load.return_value = EXCLUSION_CONFIG
         self.global_options.exclude_path_patterns = (
             {"path-pattern": "bar/", "reason": "Exclusion reason"},
         )
         test_scanner = scanner.GitRepoScanner(
-            self.global_options, self.git_options, str(self.data_dir)
+            self.global_options, self.git_options, self.data_dir
         )
         test_scanner.load_repo("../tartufo")
-        self.assertCountEqual(
-            test_scanner.excluded_paths,
-            [
-                re.compile("bar/"),
-                re.compile("tests/"),
-                re.compile(r"\.venv/"),
-                re.compile(r".*\.egg-info/"),
-            ],
+        self.assertEqual(
+            sorted(p.pattern for p in test_scanner.excluded_paths),
+            [r".*\.egg-info/", r"\.venv/", "bar/", "tests/"],
         )
 
-    @mock.patch("pygit2.Repository", new=mock.MagicMock())
-    @mock.patch("tartufo.config.load_config_from_path")
+    @mock.patch.object(pygit2, "Repository", new=mock.MagicMock())
+    @mock.patch.object(config, "load_config_from_path")
     def test_extra_signatures_get_added(self, mock_load: mock.MagicMock):
         self.global_options.target_config = True
-        mock_load.return_value = (
-            self.data_dir / "pyproject.toml",
-            {
-                "exclude_signatures": [
-                    {"signature": "foo", "reason": "Reason to exclude signature"}
-                ]
-            },
-        )
+        mock_load.return_value = SIGNATURE_CONFIG
         self.global_options.exclude_signatures = (
             {"signature": "bar", "reason": "Reason to exclude signature"},
         )
         test_scanner = scanner.GitRepoScanner(
-            self.global_options, self.git_options, str(self.data_dir)
+            self.global_options, self.git_options, self.data_dir
         )
         test_scanner.load_repo("../tartufo")
         self.assertCountEqual(test_scanner.excluded_signatures, ["bar", "foo"])
 
-    @mock.patch("pygit2.Repository", new=mock.MagicMock())
-    @mock.patch("tartufo.config.load_config_from_path")
+    @mock.patch.object(pygit2, "Repository", new=mock.MagicMock())
+    @mock.patch.object(config, "load_config_from_path")
     def test_pyproject_signatures_get_excluded(self, mock_load: mock.MagicMock):
         self.global_options.target_config = False
-        mock_load.return_value = (
-            self.data_dir / "pyproject.toml",
-            {
-                "exclude_signatures": [
-                    {"signature": "foo", "reason": "Reason to exclude signature"}
-                ]
-            },
-        )
+        mock_load.return_value = SIGNATURE_CONFIG
         self.global_options.exclude_signatures = (
             {"signature": "bar", "reason": "Reason to exclude signature"},
         )
         test_scanner = scanner.GitRepoScanner(
-            self.global_options, self.git_options, str(self.data_dir)
+            self.global_options, self.git_options, self.data_dir
         )
         test_scanner.load_repo("../tartufo")
         self.assertCountEqual(test_scanner.excluded_signatures, ["bar"])
 
 
 class FilterSubmoduleTests(ScannerTestCase):
-    @mock.patch("pygit2.Repository")
+    @mock.patch.object(pygit2, "Repository")
     def test_filter_submodules_adds_all_submodule_paths_to_exclusions(
         self, mock_repo: mock.MagicMock
     ):
         class FakeSubmodule:
+            __slots__ = ("path",)
             path: str
 
             def __init__(self, path: str):
@@ -180,18 +172,16 @@ class FilterSubmoduleTests(ScannerTestCase):
             "foo",
             "bar",
         ]
-        mock_repo.return_value.lookup_submodule.side_effect = lambda x: {
-            "foo": FakeSubmodule("foo"),
-            "bar": FakeSubmodule("bar"),
-        }[x]
+        submodules = {"foo": FakeSubmodule("foo"), "bar": FakeSubmodule("bar")}
+        mock_repo.return_value.lookup_submodule.side_effect = submodules.__getitem__
         test_scanner = scanner.GitRepoScanner(
             self.global_options, self.git_options, "."
         )
-        self.assertCountEqual(
-            test_scanner.excluded_paths, [re.compile("^foo"), re.compile("^bar")]
+        self.assertEqual(
+            sorted(p.pattern for p in test_scanner.excluded_paths), ["^bar", "^foo"]
         )
 
-    @mock.patch("pygit2.Repository")
+    @mock.patch.object(pygit2, "Repository")
     def test_filter_submodules_handles_broken_submodules_explicitly(
         self, mock_repo: mock.MagicMock
     ):
@@ -205,8 +195,8 @@ class FilterSubmoduleTests(ScannerTestCase):
         ):
             scanner.GitRepoScanner(self.global_options, self.git_options, ".")
 
-    @mock.patch("pygit2.Repository")
-    @mock.patch("tartufo.scanner.GitRepoScanner.filter_submodules")
+    @mock.patch.object(pygit2, "Repository")
+    @mock.patch.object(scanner.GitRepoScanner, "filter_submodules")
     def test_filter_submodules_skipped_for_mirror_clones(
         self, mock_filter: mock.MagicMock, mock_repo: mock.MagicMock
     ):
@@ -218,22 +208,37 @@ class FilterSubmoduleTests(ScannerTestCase):
 
 
 class ChunkGeneratorTests(ScannerTestCase):
+    # pylint: disable=too-many-instance-attributes
     def setUp(self) -> None:
-        self.diff_patcher = mock.patch("tartufo.scanner.GitScanner._iter_diff_index")
-        self.repo_patcher = mock.patch("pygit2.Repository")
-        self.shallow_patcher = mock.patch("tartufo.scanner.util.is_shallow_clone")
+        self.diff_patcher = mock.patch.object(scanner.GitScanner, "_iter_diff_index")
+        self.repo_patcher = mock.patch.object(pygit2, "Repository")
+        self.shallow_patcher = mock.patch.object(util, "is_shallow_clone")
+        self.extract_patcher = mock.patch.object(util, "extract_commit_metadata")
 
         self.mock_iter_diff = self.diff_patcher.start()
         self.mock_repo = self.repo_patcher.start()
         self.mock_shallow = self.shallow_patcher.start()
+        self.mock_extract = self.extract_patcher.start()
 
         self.mock_shallow.return_value = False
 
         self.addCleanup(self.diff_patcher.stop)
         self.addCleanup(self.repo_patcher.stop)
         self.addCleanup(self.shallow_patcher.stop)
+        self.addCleanup(self.extract_patcher.stop)
         return super().setUp()
 
+    @staticmethod
+    def _commit_chain(length: int = 3) -> List[SimpleNamespace]:
+        """Build a linear history of fake commits, newest first.
+
+        This is the order in which ``pygit2.Repository.walk`` yields them.
+        """
+        chain = [SimpleNamespace(id="commit1", parents=None)]
+        for index in range(2, length + 1):
+            chain.append(SimpleNamespace(id=f"commit{index}", parents=[chain[-1]]))
+        return list(reversed(chain))
+
     def test_single_branch_is_loaded_if_specified(self):
         self.git_options.branch = "foo"
         mock_branch_foo = mock.MagicMock()
@@ -254,49 +259,6 @@ class ChunkGeneratorTests(ScannerTestCase):
             mock_branch_foo.resolve().target, pygit2.GIT_SORT_TOPOLOGICAL
         )
 
-    def test_runs_scans_with_progressbar_enabled(self):
-        mock_branch_foo = mock.MagicMock()
-        mock_branch_bar = mock.MagicMock()
-        self.mock_repo.return_value.listall_branches.return_value = ["foo", "bar"]
-        self.mock_repo.return_value.branches = {
-            "foo": mock_branch_foo,
-            "bar": mock_branch_bar,
-        }
-        self.git_options.progress = True
-        test_scanner = scanner.GitRepoScanner(
-            self.global_options, self.git_options, "."
-        )
-
-        mock_commit_1 = mock.MagicMock()
-        mock_commit_1.parents = None
-        mock_commit_2 = mock.MagicMock()
-        mock_commit_2.parents = [mock_commit_1]
-        mock_commit_3 = mock.MagicMock()
-        mock_commit_3.parents = [mock_commit_2]
-
-        self.mock_repo.return_value.walk.return_value = [
-            mock_commit_3,
-            mock_commit_2,
-            mock_commit_1,
-        ]
-
-        self.mock_iter_diff.return_value = []
-        for _ in test_scanner.chunks:
-            pass
-
-        self.mock_repo.return_value.walk.assert_has_calls(
-            (
-                mock.call(
-                    mock_branch_foo.resolve().target, pygit2.GIT_SORT_TOPOLOGICAL
-                ),
-                mock.call(
-                    mock_branch_bar.resolve().target, pygit2.GIT_SORT_TOPOLOGICAL
-                ),
-            )
-        )
-
-        self.mock_iter_diff.assert_called()
-
     def test_all_branches_are_scanned_for_commits(self):
         mock_branch_foo = mock.MagicMock()
         mock_branch_bar = mock.MagicMock()
@@ -305,56 +267,46 @@ class ChunkGeneratorTests(ScannerTestCase):
             "foo": mock_branch_foo,
             "bar": mock_branch_bar,
         }
-        test_scanner = scanner.GitRepoScanner(
-            self.global_options, self.git_options, "."
-        )
-
-        mock_commit_1 = mock.MagicMock()
-        mock_commit_1.parents = None
-        mock_commit_2 = mock.MagicMock()
-        mock_commit_2.parents = [mock_commit_1]
-        mock_commit_3 = mock.MagicMock()
-        mock_commit_3.parents = [mock_commit_2]
-
-        self.mock_repo.return_value.walk.return_value = [
-            mock_commit_3,
-            mock_commit_2,
-            mock_commit_1,
-        ]
 
+        self.mock_repo.return_value.walk.return_value = self._commit_chain()
         self.mock_iter_diff.return_value = []
-        for _ in test_scanner.chunks:
-            pass
 
-        self.mock_repo.return_value.walk.assert_has_calls(
-            (
-                mock.call(
-                    mock_branch_foo.resolve().target, pygit2.GIT_SORT_TOPOLOGICAL
-                ),
-                mock.call(
-                    mock_branch_bar.resolve().target, pygit2.GIT_SORT_TOPOLOGICAL
-                ),
-            )
-        )
+        # The progress bar only wraps the commit iteration; every branch must
+        # be walked either way.
+        for progress in (False, True):
+            with self.subTest(progress=progress):
+                self.mock_repo.return_value.walk.reset_mock()
+                self.mock_iter_diff.reset_mock()
+                self.git_options.progress = progress
+                test_scanner = scanner.GitRepoScanner(
+                    self.global_options, self.git_options, "."
+                )
 
-        self.mock_iter_diff.assert_called()
+                for _ in test_scanner.chunks:
+                    pass
+
+                self.mock_repo.return_value.walk.assert_has_calls(
+                    (
+                        mock.call(
+                            mock_branch_foo.resolve().target,
+                            pygit2.GIT_SORT_TOPOLOGICAL,
+                        ),
+                        mock.call(
+                            mock_branch_bar.resolve().target,
+                            pygit2.GIT_SORT_TOPOLOGICAL,
+                        ),
+                    )
+                )
+                self.mock_iter_diff.assert_called()
 
     def test_all_commits_are_scanned_for_files(self):
         self.mock_repo.return_value.branches = {"foo": mock.MagicMock()}
         test_scanner = scanner.GitRepoScanner(
             self.global_options, self.git_options, "."
         )
-        mock_commit_1 = mock.MagicMock(name="commit1")
-        mock_commit_1.parents = None
-        mock_commit_2 = mock.MagicMock(name="commit2")
-        mock_commit_2.parents = [mock_commit_1]
-        mock_commit_3 = mock.MagicMock(name="commit3")
-        mock_commit_3.parents = [mock_commit_2]
-        self.mock_repo.return_value.walk.return_value = [
-            mock_commit_3,
-            mock_commit_2,
-            mock_commit_1,
-        ]
+        commits = self._commit_chain()
+        mock_commit_3, mock_commit_2, mock_commit_1 = commits
+        self.mock_repo.return_value.walk.return_value = commits
         self.mock_iter_diff.return_value = []
         for _ in test_scanner.chunks:
             pass
@@ -380,25 +332,15 @@ class ChunkGeneratorTests(ScannerTestCase):
             )
         )
 
-    @mock.patch("tartufo.util.extract_commit_metadata")
-    def test_all_files_are_yielded_as_chunks(
-        self,
-        mock_extract: mock.MagicMock,
-    ):
+    def test_all_files_are_yielded_as_chunks(self):
         self.mock_repo.return_value.branches = {"foo": mock.MagicMock()}
         test_scanner = scanner.GitRepoScanner(
             self.global_options, self.git_options, "."
         )
-        mock_commit_1 = mock.MagicMock()
-        mock_commit_1.parents = None
-        mock_commit_2 = mock.MagicMock()
-        mock_commit_2.parents = [mock_commit_1]
-        self.mock_repo.return_value.walk.return_value = [
-            mock_commit_2,
-            mock_commit_1,
-        ]
+        self.mock_repo.return_value.walk.return_value = self._commit_chain(2)
         self.mock_iter_diff.return_value = [("foo", "bar.py"), ("baz", "blah.py")]
         chunks = list(test_scanner.chunks)
+        metadata = self.mock_extract.return_value
 
         # These get duplicated in this test, because `_iter_diff` is called
         # both in the normal branch/commit iteration, and then once more afterward
@@ -406,12 +348,58 @@ class ChunkGeneratorTests(ScannerTestCase):
         self.assertEqual(
             chunks,
             [
-                types.Chunk("foo", "bar.py", mock_extract.return_value, True),
-                types.Chunk("baz", "blah.py", mock_extract.return_value, True),
-                types.Chunk("foo", "bar.py", mock_extract.return_value, True),
-                types.Chunk("baz", "blah.py", mock_extract.return_value, True),
+                types.Chunk("foo", "bar.py", metadata, True),
+                types.Chunk("baz", "blah.py", metadata, True),
+                types.Chunk("foo", "bar.py", metadata, True),
+                types.Chunk("baz", "blah.py", metadata, True),
             ],
         )
+        # Metadata is extracted once per commit, not once per file
+        self.assertEqual(self.mock_extract.call_count, 2)
+
+    def test_shared_first_commit_is_scanned_once(self):
+        self.mock_repo.return_value.branches = {
+            "foo": mock.MagicMock(),
+            "bar": mock.MagicMock(),
+        }
+        test_scanner = scanner.GitRepoScanner(
+            self.global_options, self.git_options, "."
+        )
+        self.mock_repo.return_value.walk.return_value = self._commit_chain()
+        self.mock_iter_diff.return_value = []
+
+        for _ in test_scanner.chunks:
+            pass
+
+        self.mock_repo.return_value.revparse_single.assert_called_once_with("commit1")
+
+    @mock.patch.object(scanner.GitRepoScanner, "scan_entropy")
+    def test_issues_in_shared_first_commit_are_reported_once(
+        self, mock_entropy: mock.MagicMock
+    ):
+        self.global_options.entropy = True
+        self.global_options.buffer_size = 50
+        self.mock_repo.return_value.branches = {
+            "foo": mock.MagicMock(),
+            "bar": mock.MagicMock(),
+        }
+        test_scanner = scanner.GitRepoScanner(
+            self.global_options, self.git_options, "."
+        )
+        self.mock_repo.return_value.walk.return_value = self._commit_chain()
+        first_commit_tree = (
+            self.mock_repo.return_value.revparse_single.return_value.tree.diff_to_tree
+        )
+        # Only the first commit's tree holds a file; every other diff is empty.
+        self.mock_iter_diff.side_effect = lambda diff: (
+            [("secret", "key.pem")] if diff is first_commit_tree.return_value else []
+        )
+        mock_entropy.side_effect = lambda chunk: [mock.sentinel.issue]
+
+        issues = list(test_scanner.scan())
+
+        self.assertEqual(issues, [mock.sentinel.issue])
+        self.assertEqual(test_scanner.issue_count, 1)
 
     def test_error_is_raised_when_specified_branch_is_not_found(self):
         self.git_options.branch = "foo"
@@ -430,7 +418,7 @@ class ChunkGeneratorTests(ScannerTestCase):
         self.mock_shallow.return_value = True
         self.mock_iter_diff.return_value = []
         self.mock_repo.return_value.head.target = "commit-hash"
-        mock_head = mock.MagicMock(spec=pygit2.Commit)
+        mock_head = mock.MagicMock()
         self.mock_repo.return_value.get.return_value = mock_head
 
         test_scanner = scanner.GitRepoScanner(
@@ -448,9 +436,57 @@ class ChunkGeneratorTests(ScannerTestCase):
         tree.assert_called_once_with(swap=True)
         self.mock_iter_diff.assert_called_with(tree.return_value)
 
+    def test_since_commit_is_hidden_from_history_walk(self):
+        self.git_options.since_commit = "commit1"
+        self.mock_repo.return_value.branches = {"foo": mock.MagicMock()}
+        mock_commit_3, mock_commit_2, _ = self._commit_chain()
+        mock_walker = self.mock_repo.return_value.walk.return_value
+        mock_walker.__iter__.return_value = iter([mock_commit_3, mock_commit_2])
+        self.mock_iter_diff.return_value = []
+        test_scanner = scanner.GitRepoScanner(
+            self.global_options, self.git_options, "."
+        )
+
+        for _ in test_scanner.chunks:
+            pass
+
+        mock_walker.hide.assert_called_once_with("commit1")
+        self.assertEqual(self.mock_repo.return_value.diff.call_count, 2)
+        # The oldest commit scanned still has a parent, so it must be diffed
+        # like any other commit, instead of being scanned in full.
+        self.mock_repo.return_value.revparse_single.assert_not_called()
+
+    def test_error_is_raised_when_since_commit_is_not_found(self):
+        self.git_options.since_commit = "deadbeef"
+        self.mock_repo.return_value.branches = {"foo": mock.MagicMock()}
+        self.mock_repo.return_value.walk.return_value.hide.side_effect = KeyError(
+            "deadbeef"
+        )
+        test_scanner = scanner.GitRepoScanner(
+            self.global_options, self.git_options, "."
+        )
+
+        with self.assertRaisesRegex(
+            types.ScanException, "Commit deadbeef was not found."
+        ):
+            for _ in test_scanner.chunks:
+                pass
+
 
 class IterDiffIndexTests(ScannerTestCase):
-    @mock.patch("pygit2.Repository", new=mock.MagicMock())
+    @staticmethod
+    def _fake_patch(text: str, path: str) -> SimpleNamespace:
+        """Build a stand-in for a non-binary, modified ``pygit2.Patch``."""
+        return SimpleNamespace(
+            text=text,
+            delta=SimpleNamespace(
+                is_binary=False,
+                status=pygit2.GIT_DELTA_MODIFIED,  # type: ignore[attr-defined]
+                new_file=SimpleNamespace(path=path),
+            ),
+        )
+
+    @mock.patch.object(pygit2, "Repository", new=mock.MagicMock())
     def test_binary_files_are_skipped(self):
         mock_diff = mock.MagicMock()
         mock_diff.delta.is_binary = True
@@ -460,8 +496,8 @@ class IterDiffIndexTests(ScannerTestCase):
         diffs = list(test_scanner._iter_diff_index([mock_diff]))
         self.assertEqual(diffs, [])
 
-    @mock.patch("pygit2.Repository", new=mock.MagicMock())
-    @mock.patch("tartufo.scanner.ScannerBase.should_scan")
+    @mock.patch.object(pygit2, "Repository", new=mock.MagicMock())
+    @mock.patch.object(scanner.ScannerBase, "should_scan")
     def test_excluded_files_are_not_scanned(self, mock_should: mock.MagicMock):
         mock_should.return_value = False
         mock_diff = mock.MagicMock()
@@ -473,32 +509,22 @@ class IterDiffIndexTests(ScannerTestCase):
         self.assertEqual(diffs, [])
         mock_should.assert_called_once()
 
-    @mock.patch("pygit2.Repository", new=mock.MagicMock())
-    @mock.patch(
-        "tartufo.scanner.GitScanner.header_length",
-        mock.MagicMock(side_effect=[52, 52, 0]),
+    @mock.patch.object(pygit2, "Repository", new=mock.MagicMock())
+    @mock.patch.object(
+        scanner.GitScanner,
+        "header_length",
+        mock.MagicMock(side_effect=[52, 52]),
     )
-    @mock.patch("tartufo.scanner.ScannerBase.should_scan")
+    @mock.patch.object(scanner.ScannerBase, "should_scan")
     def test_all_files_are_yielded(self, mock_should: mock.MagicMock):
         mock_should.return_value = True
-        mock_diff_1 = mock.MagicMock()
-        mock_diff_1.delta.is_binary = False
-        mock_diff_1.text = (
-            "meta_line_1\nmeta_line_2\nmeta_line_3\n+++ meta_line_4\n+ Ford Prefect"
-        )
-        mock_diff_1.delta.new_file.path = "/foo"
-        mock_diff_2 = mock.MagicMock()
-        mock_diff_2.delta.is_binary = False
-        mock_diff_2.text = (
-            "meta_line_1\nmeta_line_2\nmeta_line_3\n+++ meta_line_4\n- Marvin"
-        )
-        mock_diff_2.delta.new_file.path = "/bar"
-        mock_diff_3 = mock.MagicMock()
-        mock_diff_3.delta.is_binary = False
-        mock_diff_3.text = (
-            "meta_line_1\nsimilarity index 100%\nrename from file1\nrename to file1"
-        )
-        mock_diff_3.delta.new_file.path = "/bar"
+        mock_diff_1 = self._fake_patch(
+            "meta_line_1\nmeta_line_2\nmeta_line_3\n+++ meta_line_4\n+ Ford Prefect",
+            "/foo",
+        )
+        mock_diff_2 = self._fake_patch(
+            "meta_line_1\nmeta_line_2\nmeta_line_3\n+++ meta_line_4\n- Marvin", "/bar"
+        )
         test_scanner = scanner.GitRepoScanner(
             self.global_options, self.git_options, "."
         )
@@ -512,6 +538,7 @@ class IterDiffIndexTests(ScannerTestCase):
         )
 
 
+@mock.patch.object(pygit2, "Repository", new=mock.MagicMock())
 class HeaderLineCountTests(ScannerTestCase):
     def test_detects_there_are_four_header_lines(self):
         diff = "meta_line_1\nmeta_line_2\nmeta_line_3\n+++ meta_line_4\n+ Ford Prefect"
@@ -538,8 +565,9 @@ class HeaderLineCountTests(ScannerTestCase):
         self.assertEqual(len(diff), actual_diff_header_length)
 
 
+@mock.patch.object(pygit2, "Repository", new=mock.MagicMock())
 class ScanFilenameTests(ScannerTestCase):
-    @mock.patch("tartufo.scanner.GitScanner.header_length")
+    @mock.patch.object(scanner.GitScanner, "header_length")
     def test_scan_filename_disabled(self, mock_header_length):
         mock_diff = mock.MagicMock()
         mock_diff.delta.is_binary = False
@@ -554,7 +582,7 @@ class ScanFilenameTests(ScannerTestCase):
 
         mock_header_length.assert_called_once_with(mock_diff.text)
 
-    @mock.patch("tartufo.scanner.GitScanner.header_length")
+    @mock.patch.object(scanner.GitScanner, "header_length")
     def test_scan_filename_enabled(self, mock_header_length):
         mock_diff = mock.MagicMock()
         mock_diff.delta.is_binary = False
@@ -570,77 +598,78 @@ class ScanFilenameTests(ScannerTestCase):
         mock_header_length.assert_not_called()
 
 
-class ExcludedSignaturesTests(ScannerTestCase):
+class ConfiguredPatternsTestCase(ScannerTestCase):
+    """Tests for configuration that the scanner only reads when first accessed.
+
+    Because these values are computed lazily from ``global_options``, each test
+    can adjust the options after the scanner has been built in ``setUp``.
+    """
+
+    def setUp(self) -> None:
+        super().setUp()
+        repo_patcher = mock.patch.object(pygit2, "Repository")
+        repo_patcher.start()
+        self.addCleanup(repo_patcher.stop)
+        # Submodule filtering would compute excluded_paths during __init__,
+        # before any test has had a chance to configure it.
+        self.git_options.include_submodules = True
+        self.test_scanner = scanner.GitRepoScanner(
+            self.global_options, self.git_options, "."
+        )
+
+
+class ExcludedSignaturesTests(ConfiguredPatternsTestCase):
     def test_new_style_signatures_are_processed(self):
         self.global_options.exclude_signatures = (
             {"signature": "bar/", "reason": "path pattern"},
         )
-        test_scanner = scanner.GitRepoScanner(
-            self.global_options, self.git_options, "."
-        )
-        self.assertEqual(test_scanner.excluded_signatures, ("bar/",))
+        self.assertEqual(self.test_scanner.excluded_signatures, ("bar/",))
 
     def test_error_is_raised_when_string_signature_is_used(self):
         self.global_options.exclude_signatures = [
             "foo/",
             {"signature": "bar/", "reason": "path pattern"},
         ]
-        test_scanner = scanner.GitRepoScanner(
-            self.global_options, self.git_options, "."
-        )
         with self.assertRaisesRegex(
             ConfigException, "str signature is illegal in exclude-signatures"
         ):
-            self.assertIsNone(test_scanner.excluded_signatures)
+            self.assertIsNone(self.test_scanner.excluded_signatures)
 
 
-class IncludedPathsTests(ScannerTestCase):
+class IncludedPathsTests(ConfiguredPatternsTestCase):
     def test_new_style_included_paths_are_processed(self):
         self.global_options.include_path_patterns = (
             {"path-pattern": "bar/", "reason": "path pattern"},
         )
-        test_scanner = scanner.GitRepoScanner(
-            self.global_options, self.git_options, "."
-        )
-        self.assertEqual(test_scanner.included_paths, [re.compile("bar/")])
+        self.assertEqual(self.test_scanner.included_paths, [re.compile("bar/")])
 
     def test_error_is_raised_when_string_include_path_is_used(self):
         self.global_options.include_path_patterns = [
             "foo/",
             {"path-pattern": "bar/", "reason": "path pattern"},
         ]
-        test_scanner = scanner.GitRepoScanner(
-            self.global_options, self.git_options, "."
-        )
         with self.assertRaisesRegex(
             ConfigException, "str pattern is illegal in include-path-patterns"
         ):
-            self.assertIsNone(test_scanner.included_paths)
+            self.assertIsNone(self.test_scanner.included_paths)
 
 
-class ExcludedPathsTests(ScannerTestCase):
+class ExcludedPathsTests(ConfiguredPatternsTestCase):
     def test_new_style_excluded_paths_are_processed(self):
         self.global_options.exclude_path_patterns = (
             {"path-pattern": "bar/", "reason": "path pattern"},
         )
-        test_scanner = scanner.GitRepoScanner(
-            self.global_options, self.git_options, "."
-        )
-        self.assertEqual(test_scanner.excluded_paths, [re.compile("bar/")])
+        self.assertEqual(self.test_scanner.excluded_paths, [re.compile("bar/")])
 
-    @mock.patch("tartufo.scanner.GitScanner.filter_submodules", mock.MagicMock())
     def test_error_is_raised_when_string_exclude_path_is_used(self):
         self.global_options.exclude_path_patterns = [
             "foo/",
             {"path-pattern": "bar/", "reason": "path pattern"},
         ]
-        test_scanner = scanner.GitRepoScanner(
-            self.global_options, self.git_options, "."
-        )
         with self.assertRaisesRegex(
             ConfigException, "str pattern is illegal in exclude-path-patterns"
         ):
-            self.assertIsNone(test_scanner.excluded_paths)
+            self.assertIsNone(self.test_scanner.excluded_paths)
 
 
 if __name__ == "__main__":
@@ -2,119 +2,85 @@ import unittest
 from pathlib import Path
 from unittest import mock
 
-from click.testing import CliRunner
-
-from tartufo import cli, types
+from tartufo import cli, types, util
+from tartufo.commands import scan_remote_repo
 
 from tests import helpers
 
 
-class ScanRemoteRepoTests(unittest.TestCase):
-    @mock.patch("tartufo.commands.scan_remote_repo.util.clone_git_repo")
-    @mock.patch("tartufo.commands.scan_remote_repo.GitRepoScanner")
-    @mock.patch("tartufo.commands.scan_remote_repo.rmtree", new=mock.MagicMock())
-    def test_scan_clones_remote_repo(
-        self, mock_scanner: mock.MagicMock, mock_clone: mock.MagicMock
-    ):
-        mock_scanner.return_value.scan.return_value = []
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            runner.invoke(
-                cli.main, ["scan-remote-repo", "git@github.com:godaddy/tartufo.git"]
-            )
-        mock_clone.assert_called_once_with("git@github.com:godaddy/tartufo.git", None)
+class ScanRemoteRepoTests(helpers.CliTestMixin, unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        # Every test needs the clone, the scanner and the clone's removal mocked out.
+        scanner_patcher = mock.patch.object(scan_remote_repo, "GitRepoScanner")
+        clone_patcher = mock.patch.object(util, "clone_git_repo")
+        rmtree_patcher = mock.patch.object(scan_remote_repo, "rmtree")
+        self.mock_scanner = scanner_patcher.start()
+        self.mock_clone = clone_patcher.start()
+        self.mock_rmtree = rmtree_patcher.start()
+        self.addCleanup(scanner_patcher.stop)
+        self.addCleanup(clone_patcher.stop)
+        self.addCleanup(rmtree_patcher.stop)
+        self.mock_scanner.return_value.scan.return_value = []
 
-    @mock.patch("tartufo.commands.scan_remote_repo.util.clone_git_repo")
-    @mock.patch("tartufo.commands.scan_remote_repo.GitRepoScanner")
-    @mock.patch("tartufo.commands.scan_remote_repo.rmtree", new=mock.MagicMock())
-    def test_cloned_path_is_scanned(
-        self, mock_scanner: mock.MagicMock, mock_clone: mock.MagicMock
-    ):
-        mock_scanner.return_value.scan.return_value = []
-        runner = CliRunner()
-        with runner.isolated_filesystem() as dirname:
-            mock_clone.return_value = (Path(dirname), "origin")
-            runner.invoke(
-                cli.main, ["scan-remote-repo", "git@github.com:godaddy/tartufo.git"]
-            )
-        self.assertEqual(mock_scanner.call_args[0][2], dirname)
+    def test_remote_repo_is_cloned_and_scanned(self):
+        clone_dir = self.make_temp_dir()
+        self.mock_clone.return_value = (Path(clone_dir), "origin")
+        self.runner.invoke(
+            cli.main, ["scan-remote-repo", "git@github.com:godaddy/tartufo.git"]
+        )
+        self.mock_clone.assert_called_once_with(
+            "git@github.com:godaddy/tartufo.git", None
+        )
+        self.assertEqual(self.mock_scanner.call_args[0][2], clone_dir)
 
-    @mock.patch("tartufo.commands.scan_remote_repo.util.clone_git_repo")
-    @mock.patch("tartufo.commands.scan_remote_repo.GitRepoScanner")
-    @mock.patch("tartufo.commands.scan_remote_repo.Path")
-    @mock.patch("tartufo.commands.scan_remote_repo.rmtree")
-    def test_clone_is_deleted_after_scan(
-        self,
-        mock_rmtree: mock.MagicMock,
-        mock_path: mock.MagicMock,
-        mock_scanner: mock.MagicMock,
-        mock_clone: mock.MagicMock,
-    ):
-        mock_scanner.return_value.scan.return_value = []
-        mock_path.return_value.exists.return_value = True
-        runner = CliRunner()
-        with runner.isolated_filesystem() as dirname:
-            mock_clone.return_value = (Path(dirname), "origin")
-            runner.invoke(
-                cli.main, ["scan-remote-repo", "git@github.com:godaddy/tartufo.git"]
-            )
-            self.assertEqual(mock_rmtree.call_args[0][0], dirname)
+    def test_clone_is_deleted_after_scan(self):
+        # The "clone" is a real, existing directory, so the command sees it on
+        # disk; rmtree itself is mocked out in setUp.
+        clone_dir = self.make_temp_dir()
+        self.mock_clone.return_value = (Path(clone_dir), "origin")
+        self.runner.invoke(
+            cli.main, ["scan-remote-repo", "git@github.com:godaddy/tartufo.git"]
+        )
+        self.assertEqual(self.mock_rmtree.call_args[0][0], clone_dir)
 
-    @mock.patch("tartufo.commands.scan_remote_repo.util.clone_git_repo")
-    @mock.patch("tartufo.commands.scan_remote_repo.GitRepoScanner")
-    @mock.patch("tartufo.commands.scan_remote_repo.rmtree", new=mock.MagicMock())
-    def test_command_fails_on_clone_error(
-        self, mock_scanner: mock.MagicMock, mock_clone: mock.MagicMock
-    ):
-        mock_clone.side_effect = types.GitException("stderr: 'Bad repo. Bad.'")
-        mock_scanner.return_value.scan.return_value = []
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            result = runner.invoke(
-                cli.main, ["scan-remote-repo", "git@github.com:godaddy/tartufo.git"]
-            )
+    def test_command_fails_on_clone_error(self):
+        self.mock_clone.side_effect = types.GitException("stderr: 'Bad repo. Bad.'")
+        result = self.runner.invoke(
+            cli.main, ["scan-remote-repo", "git@github.com:godaddy/tartufo.git"]
+        )
         self.assertEqual(
             result.output, "Error cloning remote repo: stderr: 'Bad repo. Bad.'\n"
         )
 
-    @mock.patch("tartufo.commands.scan_remote_repo.util.clone_git_repo")
-    @mock.patch("tartufo.commands.scan_remote_repo.GitRepoScanner")
-    @mock.patch("tartufo.commands.scan_remote_repo.rmtree", new=mock.MagicMock())
-    def test_command_fails_on_scan_exception(
-        self, mock_scanner: mock.MagicMock, mock_clone: mock.MagicMock
-    ):
-        mock_clone.return_value = (Path("/foo"), "origin")
-        mock_scanner.return_value.scan.side_effect = types.ScanException("Scan failed!")
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            result = runner.invoke(
-                cli.main, ["scan-remote-repo", "git@github.com:godaddy/tartufo.git"]
-            )
+    def test_command_fails_on_scan_exception(self):
+        self.mock_clone.return_value = (Path("/foo"), "origin")
+        self.mock_scanner.return_value.scan.side_effect = types.ScanException(
+            "Scan failed!"
+        )
+        result = self.runner.invoke(
+            cli.main, ["scan-remote-repo", "git@github.com:godaddy/tartufo.git"]
+        )
         self.assertEqual(result.output, "Scan failed!\n")
 
     @unittest.skipIf(
         helpers.BROKEN_USER_PATHS, "Skipping due to truncated Windows usernames"
     )
-    @mock.patch("tartufo.commands.scan_remote_repo.util.clone_git_repo")
-    @mock.patch("tartufo.commands.scan_remote_repo.GitRepoScanner")
-    @mock.patch("tartufo.commands.scan_remote_repo.rmtree", new=mock.MagicMock())
-    def test_subdir_of_work_dir_is_passed_to_clone_repo(
-        self, mock_scanner: mock.MagicMock, mock_clone: mock.MagicMock
-    ):
-        mock_scanner.return_value.scan.return_value = []
-        runner = CliRunner()
-        with runner.isolated_filesystem() as dirname:
-            mock_clone.return_value = Path("/foo")
-            runner.invoke(
-                cli.main,
-                [
-                    "scan-remote-repo",
-                    "--work-dir",
-                    dirname,
-                    "git@github.com:godaddy/tartufo.git",
-                ],
-            )
-            mock_clone.assert_called_once_with(
+    def test_subdir_of_work_dir_is_passed_to_clone_repo(self):
+        # The command creates the clone directory inside the work dir, so give
+        # this test a work dir of its own.
+        dirname = self.make_temp_dir()
+        self.mock_clone.return_value = Path("/foo")
+        self.runner.invoke(
+            cli.main,
+            [
+                "scan-remote-repo",
+                "--work-dir",
+                dirname,
                 "git@github.com:godaddy/tartufo.git",
-                Path(dirname).resolve() / "tartufo.git",
-            )
+            ],
+        )
+        self.mock_clone.assert_called_once_with(
+            "git@github.com:godaddy/tartufo.git",
+            Path(dirname).resolve() / "tartufo.git",
+        )
@@ -1,88 +1,78 @@
 import io
 import textwrap
-from os import remove
 from pathlib import Path
 from typing import Sequence, Set
 
 from unittest import mock, TestCase
 import tomlkit
-from click.testing import CliRunner
 
-from tartufo import cli, types
+from tartufo import cli, types, util
 from tartufo.commands import update_signatures
 
+from tests.helpers import REPO_ROOT_PATH, CliTestMixin
 
-class UpdateSignaturesTests(TestCase):
-    @mock.patch("tartufo.commands.update_signatures.load_config_from_path")
-    def test_with_no_signatures_in_config(
-        self, mock_load_config: mock.MagicMock
-    ) -> None:
-        mock_load_config.return_value = Path("."), {"test": None}
 
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            result = runner.invoke(cli.main, ["update-signatures", "."])
+class UpdateSignaturesTests(CliTestMixin, TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        # Every command test needs the configuration mocked out, and the other
+        # tests never load it, so patch it once for the whole class.
+        config_patcher = mock.patch.object(update_signatures, "load_config_from_path")
+        self.mock_load_config = config_patcher.start()
+        self.addCleanup(config_patcher.stop)
+
+    def test_with_no_signatures_in_config(self) -> None:
+        self.mock_load_config.return_value = Path("."), {"test": None}
+
+        result = self.runner.invoke(cli.main, ["update-signatures", "."])
 
-        mock_load_config.assert_called_once()
+        self.mock_load_config.assert_called_once()
         self.assertEqual(
             result.output, "No signatures found in configuration, exiting...\n"
         )
 
-    @mock.patch("tartufo.commands.update_signatures.load_config_from_path")
-    def test_with_no_config(self, mock_load_config: mock.MagicMock) -> None:
-        mock_load_config.side_effect = FileNotFoundError()
+    def test_with_no_config(self) -> None:
+        self.mock_load_config.side_effect = FileNotFoundError()
 
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            result = runner.invoke(cli.main, ["update-signatures", "."])
+        result = self.runner.invoke(cli.main, ["update-signatures", "."])
 
-        mock_load_config.assert_called_once()
+        self.mock_load_config.assert_called_once()
         self.assertEqual(result.output, "No tartufo config found, exiting...\n")
 
-    @mock.patch("tartufo.commands.update_signatures.GitRepoScanner")
-    @mock.patch("tartufo.commands.update_signatures.load_config_from_path")
-    def test_with_no_deprecated_signatures(
-        self, mock_load_config: mock.MagicMock, mock_scanner: mock.MagicMock
-    ) -> None:
-        mock_load_config.return_value = Path("."), {
+    @mock.patch.object(update_signatures, "GitRepoScanner")
+    def test_with_no_deprecated_signatures(self, mock_scanner: mock.MagicMock) -> None:
+        self.mock_load_config.return_value = Path("."), {
             "exclude_signatures": [{"signature": "a"}]
         }
 
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            result = runner.invoke(cli.main, ["update-signatures", "."])
+        result = self.runner.invoke(cli.main, ["update-signatures", "."])
 
         mock_scanner.assert_called_once()
-        mock_load_config.assert_called_once()
+        self.mock_load_config.assert_called_once()
         self.assertEqual(result.output, "Found 0 deprecated signatures.\n")
 
-    @mock.patch("tartufo.commands.update_signatures.scan_local_repo")
-    @mock.patch("tartufo.commands.update_signatures.load_config_from_path")
+    @mock.patch.object(update_signatures, "scan_local_repo")
     def test_update_signatures_when_scanner_is_none(
-        self, mock_load_config: mock.MagicMock, mock_scan_local: mock.MagicMock
+        self, mock_scan_local: mock.MagicMock
     ) -> None:
         mock_scan_local.return_value = None, "b"
-        mock_load_config.return_value = Path("."), {
+        self.mock_load_config.return_value = Path("."), {
             "exclude_signatures": [{"signature": "a"}]
         }
 
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            result = runner.invoke(cli.main, ["update-signatures", "."])
+        result = self.runner.invoke(cli.main, ["update-signatures", "."])
 
         mock_scan_local.assert_called_once()
-        mock_load_config.assert_called_once()
+        self.mock_load_config.assert_called_once()
         self.assertGreater(result.exit_code, 0)
         self.assertEqual(result.output, "Unable to update signatures\n")
 
-    @mock.patch("tartufo.commands.update_signatures.write_updated_signatures")
-    @mock.patch("tartufo.commands.update_signatures.get_deprecations")
-    @mock.patch("tartufo.commands.update_signatures.remove_duplicated_entries")
-    @mock.patch("tartufo.commands.update_signatures.scan_local_repo")
-    @mock.patch("tartufo.commands.update_signatures.load_config_from_path")
+    @mock.patch.object(update_signatures, "write_updated_signatures")
+    @mock.patch.object(update_signatures, "get_deprecations")
+    @mock.patch.object(update_signatures, "remove_duplicated_entries")
+    @mock.patch.object(update_signatures, "scan_local_repo")
     def test_when_no_remove_duplicates(
         self,
-        mock_load_config: mock.MagicMock,
         mock_scan_local: mock.MagicMock,
         mock_remove_dups: mock.MagicMock,
         mock_get_deprecations: mock.MagicMock,
@@ -92,30 +82,26 @@ class UpdateSignaturesTests(TestCase):
         mock_write.return_value = None
         mock_get_deprecations.return_value = {("123", "abc"), ("456", "def")}
         mock_scan_local.return_value = mock_scanner, "b"
-        mock_load_config.return_value = Path("."), {
+        self.mock_load_config.return_value = Path("."), {
             "exclude_signatures": [{"signature": "a"}]
         }
 
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            runner.invoke(
-                cli.main, ["update-signatures", ".", "--no-remove-duplicates"]
-            )
+        self.runner.invoke(
+            cli.main, ["update-signatures", ".", "--no-remove-duplicates"]
+        )
 
         mock_get_deprecations.assert_called_once()
         mock_remove_dups.assert_not_called()
         mock_scan_local.assert_called_once()
-        mock_load_config.assert_called_once()
+        self.mock_load_config.assert_called_once()
         mock_write.assert_called_once()
 
-    @mock.patch("tartufo.commands.update_signatures.write_updated_signatures")
-    @mock.patch("tartufo.commands.update_signatures.get_deprecations")
-    @mock.patch("tartufo.commands.update_signatures.remove_duplicated_entries")
-    @mock.patch("tartufo.commands.update_signatures.scan_local_repo")
-    @mock.patch("tartufo.commands.update_signatures.load_config_from_path")
+    @mock.patch.object(update_signatures, "write_updated_signatures")
+    @mock.patch.object(update_signatures, "get_deprecations")
+    @mock.patch.object(update_signatures, "remove_duplicated_entries")
+    @mock.patch.object(update_signatures, "scan_local_repo")
     def test_when_remove_duplicates(
         self,
-        mock_load_config: mock.MagicMock,
         mock_scan_local: mock.MagicMock,
         mock_remove_dups: mock.MagicMock,
         mock_get_deprecations: mock.MagicMock,
@@ -125,55 +111,59 @@ class UpdateSignaturesTests(TestCase):
         mock_scan_local.return_value = mock_scanner, "b"
         mock_write.return_value = None
         mock_get_deprecations.return_value = {("123", "abc"), ("456", "def")}
-        mock_load_config.return_value = Path("."), {
+        self.mock_load_config.return_value = Path("."), {
             "exclude_signatures": [{"signature": "a"}]
         }
 
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            runner.invoke(cli.main, ["update-signatures", "."])
+        self.runner.invoke(cli.main, ["update-signatures", "."])
 
         mock_get_deprecations.assert_called_once()
         mock_remove_dups.assert_called_once()
         mock_scan_local.assert_called_once()
-        mock_load_config.assert_called_once()
+        self.mock_load_config.assert_called_once()
         mock_write.assert_called_once()
 
-    @mock.patch("tartufo.commands.update_signatures.types.GlobalOptions")
-    @mock.patch("tartufo.commands.update_signatures.util.process_issues")
+    @mock.patch.object(types, "GlobalOptions")
+    @mock.patch.object(util, "process_issues")
     def test_scan_local_with_git_local_exc(
         self, mock_process_issues: mock.MagicMock, mock_global_options: mock.MagicMock
     ) -> None:
         mock_process_issues.side_effect = types.GitLocalException()
 
+        repo_path = str(REPO_ROOT_PATH)
         scanner, stderr = update_signatures.scan_local_repo(
-            mock_global_options, ".", None, 1, None, False
+            mock_global_options, repo_path, None, 1, None, False
         )
 
-        mock_process_issues.assert_called_once_with(".", scanner, mock_global_options)
-        self.assertEqual(stderr.getvalue(), ". is not a valid git repository.\n")
+        mock_process_issues.assert_called_once_with(
+            repo_path, scanner, mock_global_options
+        )
+        self.assertEqual(
+            stderr.getvalue(), f"{repo_path} is not a valid git repository.\n"
+        )
 
-    @mock.patch("tartufo.commands.update_signatures.types.GlobalOptions")
-    @mock.patch("tartufo.commands.update_signatures.util.process_issues")
+    @mock.patch.object(types, "GlobalOptions")
+    @mock.patch.object(util, "process_issues")
     def test_scan_local_with_tartufo_exc(
         self, mock_process_issues: mock.MagicMock, mock_global_options: mock.MagicMock
     ) -> None:
         mock_process_issues.side_effect = types.TartufoException("TARTUFO EXC")
 
+        repo_path = str(REPO_ROOT_PATH)
         scanner, stderr = update_signatures.scan_local_repo(
-            mock_global_options, ".", None, 1, None, False
+            mock_global_options, repo_path, None, 1, None, False
         )
 
-        mock_process_issues.assert_called_once_with(".", scanner, mock_global_options)
+        mock_process_issues.assert_called_once_with(
+            repo_path, scanner, mock_global_options
+        )
         self.assertEqual(stderr.getvalue(), "TARTUFO EXC\n")
 
-    @mock.patch("tartufo.commands.update_signatures.write_updated_signatures")
-    @mock.patch("tartufo.commands.update_signatures.get_deprecations")
-    @mock.patch("tartufo.commands.update_signatures.scan_local_repo")
-    @mock.patch("tartufo.commands.update_signatures.load_config_from_path")
+    @mock.patch.object(update_signatures, "write_updated_signatures")
+    @mock.patch.object(update_signatures, "get_deprecations")
+    @mock.patch.object(update_signatures, "scan_local_repo")
     def test_found_output_with_signatures(
         self,
-        mock_load_config: mock.MagicMock,
         mock_scan_local: mock.MagicMock,
         mock_get_deprecations: mock.MagicMock,
         mock_write: mock.MagicMock,
@@ -189,18 +179,16 @@ class UpdateSignaturesTests(TestCase):
             ),
         )
 
-        mock_load_config.return_value = Path("."), {
+        self.mock_load_config.return_value = Path("."), {
             "exclude_signatures": [{"signature": "123"}, {"signature": "456"}]
         }
 
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            result = runner.invoke(cli.main, ["update-signatures", "."])
+        result = self.runner.invoke(cli.main, ["update-signatures", "."])
 
         mock_write.assert_called_once()
         mock_get_deprecations.assert_called_once()
         mock_scan_local.assert_called_once()
-        mock_load_config.assert_called_once()
+        self.mock_load_config.assert_called_once()
         self.assertTrue(result.output.startswith("Found 2 deprecated signatures.\n"))
 
         # The numbers before the paren can vary so we leave them out of the test
@@ -209,13 +197,11 @@ class UpdateSignaturesTests(TestCase):
         self.assertTrue("Removed 0 duplicated signatures.\n" in result.output)
         self.assertTrue(result.output.endswith("Updated 2 deprecated signatures.\n"))
 
-    @mock.patch("tartufo.commands.update_signatures.write_updated_signatures")
-    @mock.patch("tartufo.commands.update_signatures.get_deprecations")
-    @mock.patch("tartufo.commands.update_signatures.scan_local_repo")
-    @mock.patch("tartufo.commands.update_signatures.load_config_from_path")
+    @mock.patch.object(update_signatures, "write_updated_signatures")
+    @mock.patch.object(update_signatures, "get_deprecations")
+    @mock.patch.object(update_signatures, "scan_local_repo")
     def test_found_output_with_duplicated_signatures(
         self,
-        mock_load_config: mock.MagicMock,
         mock_scan_local: mock.MagicMock,
         mock_get_deprecations: mock.MagicMock,
         mock_write: mock.MagicMock,
@@ -237,7 +223,7 @@ class UpdateSignaturesTests(TestCase):
             ),
         )
 
-        mock_load_config.return_value = Path("."), {
+        self.mock_load_config.return_value = Path("."), {
             "exclude_signatures": [
                 {"signature": "123"},
                 {"signature": "456"},
@@ -245,14 +231,12 @@ class UpdateSignaturesTests(TestCase):
             ]
         }
 
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            result = runner.invoke(cli.main, ["update-signatures", "."])
+        result = self.runner.invoke(cli.main, ["update-signatures", "."])
 
         mock_write.assert_called_once()
         mock_get_deprecations.assert_called_once()
         mock_scan_local.assert_called_once()
-        mock_load_config.assert_called_once()
+        self.mock_load_config.assert_called_once()
         self.assertTrue(result.output.startswith("Found 3 deprecated signatures.\n"))
 
         # The numbers before the paren can vary so we leave them out of the test
@@ -262,14 +246,12 @@ class UpdateSignaturesTests(TestCase):
         self.assertTrue("Removed 1 duplicated signature.\n" in result.output)
         self.assertTrue(result.output.endswith("Updated 3 deprecated signatures.\n"))
 
-    @mock.patch("tartufo.commands.update_signatures.write_updated_signatures")
-    @mock.patch("tartufo.commands.update_signatures.replace_deprecated_signatures")
-    @mock.patch("tartufo.commands.update_signatures.get_deprecations")
-    @mock.patch("tartufo.commands.update_signatures.scan_local_repo")
-    @mock.patch("tartufo.commands.update_signatures.load_config_from_path")
+    @mock.patch.object(update_signatures, "write_updated_signatures")
+    @mock.patch.object(update_signatures, "replace_deprecated_signatures")
+    @mock.patch.object(update_signatures, "get_deprecations")
+    @mock.patch.object(update_signatures, "scan_local_repo")
     def test_found_output_with_no_signatures(
         self,
-        mock_load_config: mock.MagicMock,
         mock_scan_local: mock.MagicMock,
         mock_get_deprecations: mock.MagicMock,
         mock_replace: mock.MagicMock,
@@ -280,11 +262,9 @@ class UpdateSignaturesTests(TestCase):
         mock_replace.return_value = 2
         mock_get_deprecations.return_value = {}
         mock_scan_local.return_value = mock_scanner, ""
-        mock_load_config.return_value = Path("."), {"exclude_signatures": "a"}
+        self.mock_load_config.return_value = Path("."), {"exclude_signatures": "a"}
 
-        runner = CliRunner()
-        with runner.isolated_filesystem():
-            result = runner.invoke(cli.main, ["update-signatures", "."])
+        result = self.runner.invoke(cli.main, ["update-signatures", "."])
 
         mock_replace.assert_called_once()
         mock_get_deprecations.assert_called_once()
@@ -368,7 +348,9 @@ class UpdateSignaturesTests(TestCase):
         self.assertEqual(config_data, expected_result)
 
     def test_write_updated_signatures(self) -> None:
-        file_name = Path("test.toml")
+        # Write the config to a directory of this test's own, which is cleaned
+        # up even if the test fails.
+        file_name = Path(self.make_temp_dir()) / "test.toml"
         initial_file_content = textwrap.dedent(
             """[tool.tartufo]
             exclude-signatures = [
@@ -389,8 +371,7 @@ class UpdateSignaturesTests(TestCase):
             ]
         }
 
-        with open(file_name, "w") as config_file:
-            config_file.write(initial_file_content)
+        file_name.write_text(initial_file_content)
 
         update_signatures.replace_deprecated_signatures(
             expected_deprecations, config_data
@@ -405,8 +386,4 @@ class UpdateSignaturesTests(TestCase):
             }
         }
 
-        with open(file_name, "r") as config_file:
-            file_content = config_file.read()
-            self.assertEqual(result_config_data, tomlkit.loads(file_content))
-
-        remove(file_name)
+        self.assertEqual(result_config_data, tomlkit.loads(file_name.read_text()))
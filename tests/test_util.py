@@ -120,6 +120,11 @@ class GitTests(unittest.TestCase):
 
 
 class OutputTests(unittest.TestCase):
+    def setUp(self) -> None:
+        # Styles are module-global state; reset them so these tests do not
+        # depend on which other tests happened to run before them.
+        util.init_styles(generate_options(GlobalOptions, color=False))
+
     @mock.patch("tartufo.scanner.ScannerBase")
     @mock.patch("tartufo.util.click")
     def test_echo_result_echos_all_when_not_json(self, mock_click, mock_scanner):